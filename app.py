@@ -1,13 +1,12 @@
-# Update the Streamlit app with detailed calculations section
-streamlit_app_content = '''import streamlit as st
+import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 from datetime import datetime
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import MISSING, astuple, dataclass, fields
+from typing import NamedTuple
+import csv
+import io
 import json
 
 # Page config
@@ -18,7 +17,7 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrainingParameters:
     """Parameter für das Sales-Training"""
     participants: int
@@ -31,8 +30,7 @@ class TrainingParameters:
     training_days: int = 3
     daily_rate: float = 400.0
 
-@dataclass
-class ROIResults:
+class ROIResults(NamedTuple):
     """Ergebnisse der ROI-Berechnung"""
     total_investment: float
     training_costs: float
@@ -48,275 +46,495 @@ class ROIResults:
     payback_days: int
     net_benefit: float
 
-class SalesROICalculator:
-    """Sales-Training ROI Kalkulator"""
-    
-    def __init__(self):
-        self.parameters: Optional[TrainingParameters] = None
-        self.results: Optional[ROIResults] = None
-    
-    def format_currency(self, amount: float) -> str:
-        """Formatiere Betrag als Währung"""
-        return f"{amount:,.0f} €".replace(",", ".")
-    
-    def format_number(self, number: float, decimals: int = 1) -> str:
-        """Formatiere Zahl mit Dezimalstellen"""
-        return f"{number:,.{decimals}f}".replace(",", ".")
-    
-    def calculate_roi(self, params: TrainingParameters) -> ROIResults:
-        """Berechne ROI basierend auf Parametern"""
-        self.parameters = params
-        
-        # 1. Gesamtinvestition berechnen
-        training_costs = params.participants * params.cost_per_person
-        opportunity_costs = params.participants * params.training_days * params.daily_rate
+def format_currency(amount: float) -> str:
+    """Formatiere Betrag als Währung"""
+    return f"{amount:,.0f} €".replace(",", ".")
+
+def format_number(number: float, decimals: int = 1) -> str:
+    """Formatiere Zahl mit Dezimalstellen"""
+    return f"{number:,.{decimals}f}".replace(",", ".")
+
+def calculate_roi(params: TrainingParameters) -> ROIResults:
+    """Berechne ROI basierend auf Parametern"""
+    return _calc_roi(
+        params.participants,
+        params.cost_per_person,
+        params.monthly_leads,
+        params.current_close_rate,
+        params.target_close_rate,
+        params.deal_value,
+        params.margin_rate,
+        params.training_days,
+        params.daily_rate
+    )
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _calc_roi(participants, cost_per_person, monthly_leads, current_rate, target_rate,
+              deal_value, margin_rate, training_days, daily_rate) -> ROIResults:
+    """Gecachte ROI-Berechnung (Schlüssel: die primitiven Parameterwerte)"""
+    # 1. Gesamtinvestition berechnen
+    training_costs = participants * cost_per_person
+    opportunity_costs = participants * training_days * daily_rate
+    total_investment = training_costs + opportunity_costs
+    
+    # 2. Zusätzliche Deals berechnen
+    current_deals = monthly_leads * (current_rate / 100)
+    target_deals = monthly_leads * (target_rate / 100)
+    additional_deals = target_deals - current_deals
+    
+    # 3. Umsatz- und Margen-Impact
+    monthly_revenue = additional_deals * deal_value
+    monthly_margin = monthly_revenue * (margin_rate / 100)
+    annual_margin = monthly_margin * 12
+    
+    # 4. ROI-Metriken
+    net_benefit = annual_margin - total_investment
+    roi_percentage = (net_benefit / total_investment) * 100 if total_investment > 0 else 0
+    roi_multiple = net_benefit / total_investment if total_investment > 0 else 0
+    payback_days = int((total_investment / monthly_margin) * 30) if monthly_margin > 0 else 0
+    
+    return ROIResults(
+        total_investment=total_investment,
+        training_costs=training_costs,
+        opportunity_costs=opportunity_costs,
+        current_deals=current_deals,
+        target_deals=target_deals,
+        additional_deals=additional_deals,
+        monthly_revenue=monthly_revenue,
+        monthly_margin=monthly_margin,
+        annual_margin=annual_margin,
+        roi_percentage=roi_percentage,
+        roi_multiple=roi_multiple,
+        payback_days=payback_days,
+        net_benefit=net_benefit
+    )
+
+def _roi_batch_numpy(participants, cost_per_person, monthly_leads, current_rate, target_rate,
+                     deal_value, margin_rate, training_days, daily_rate) -> dict:
+    """Alle ROI-Kennzahlen für flache Parameter-Arrays (NumPy-Fallback ohne numba)"""
+    training_costs = participants * cost_per_person
+    opportunity_costs = participants * training_days * daily_rate
+    total_investment = training_costs + opportunity_costs
+    
+    current_deals = monthly_leads * (current_rate / 100)
+    target_deals = monthly_leads * (target_rate / 100)
+    additional_deals = target_deals - current_deals
+    
+    monthly_revenue = additional_deals * deal_value
+    monthly_margin = monthly_revenue * (margin_rate / 100)
+    annual_margin = monthly_margin * 12
+    
+    net_benefit = annual_margin - total_investment
+    roi_multiple = np.divide(net_benefit, total_investment,
+                             out=np.zeros_like(net_benefit), where=total_investment > 0)
+    payback = np.divide(total_investment, monthly_margin,
+                        out=np.zeros_like(net_benefit), where=monthly_margin > 0) * 30
+    
+    return {
+        'total_investment': total_investment,
+        'training_costs': training_costs,
+        'opportunity_costs': opportunity_costs,
+        'current_deals': current_deals,
+        'target_deals': target_deals,
+        'additional_deals': additional_deals,
+        'monthly_revenue': monthly_revenue,
+        'monthly_margin': monthly_margin,
+        'annual_margin': annual_margin,
+        'roi_percentage': roi_multiple * 100,
+        'roi_multiple': roi_multiple,
+        'payback_days': payback,
+        'net_benefit': net_benefit
+    }
+
+def _roi_batch_loop(participants, cost_per_person, monthly_leads, current_rate, target_rate,
+                    deal_value, margin_rate, training_days, daily_rate, out):
+    """Alle ROI-Kennzahlen in einer Schleife (Vorlage für den numba-Kernel)
+    
+    Schreibt eine Zeile pro Feld von ROIResults (gleiche Reihenfolge) in `out`.
+    """
+    for i in range(participants.size):
+        training_costs = participants[i] * cost_per_person[i]
+        opportunity_costs = participants[i] * training_days[i] * daily_rate[i]
         total_investment = training_costs + opportunity_costs
-        
-        # 2. Zusätzliche Deals berechnen
-        current_deals = params.monthly_leads * (params.current_close_rate / 100)
-        target_deals = params.monthly_leads * (params.target_close_rate / 100)
+        current_deals = monthly_leads[i] * (current_rate[i] / 100)
+        target_deals = monthly_leads[i] * (target_rate[i] / 100)
         additional_deals = target_deals - current_deals
-        
-        # 3. Umsatz- und Margen-Impact
-        monthly_revenue = additional_deals * params.deal_value
-        monthly_margin = monthly_revenue * (params.margin_rate / 100)
+        monthly_revenue = additional_deals * deal_value[i]
+        monthly_margin = monthly_revenue * (margin_rate[i] / 100)
         annual_margin = monthly_margin * 12
-        
-        # 4. ROI-Metriken
         net_benefit = annual_margin - total_investment
-        roi_percentage = (net_benefit / total_investment) * 100 if total_investment > 0 else 0
-        roi_multiple = net_benefit / total_investment if total_investment > 0 else 0
-        payback_days = int((total_investment / monthly_margin) * 30) if monthly_margin > 0 else 0
-        
-        self.results = ROIResults(
-            total_investment=total_investment,
-            training_costs=training_costs,
-            opportunity_costs=opportunity_costs,
-            current_deals=current_deals,
-            target_deals=target_deals,
-            additional_deals=additional_deals,
-            monthly_revenue=monthly_revenue,
-            monthly_margin=monthly_margin,
-            annual_margin=annual_margin,
-            roi_percentage=roi_percentage,
-            roi_multiple=roi_multiple,
-            payback_days=payback_days,
-            net_benefit=net_benefit
-        )
         
-        return self.results
+        out[0, i] = total_investment
+        out[1, i] = training_costs
+        out[2, i] = opportunity_costs
+        out[3, i] = current_deals
+        out[4, i] = target_deals
+        out[5, i] = additional_deals
+        out[6, i] = monthly_revenue
+        out[7, i] = monthly_margin
+        out[8, i] = annual_margin
+        roi_multiple = net_benefit / total_investment if total_investment > 0 else 0.0
+        out[9, i] = roi_multiple * 100
+        out[10, i] = roi_multiple
+        out[11, i] = (total_investment / monthly_margin) * 30 if monthly_margin > 0 else 0.0
+        out[12, i] = net_benefit
 
-def create_calculation_breakdown(calculator):
-    """Erstelle detaillierte Kalkulationsübersicht"""
-    if not calculator.results or not calculator.parameters:
-        return None
-    
-    params = calculator.parameters
-    results = calculator.results
-    
-    # Create calculation dataframe
-    calc_data = []
-    
-    # 1. Investment Breakdown
-    calc_data.append({
-        'Kategorie': '💸 INVESTMENT',
-        'Berechnung': '',
-        'Formel': '',
-        'Ergebnis': ''
-    })
-    
-    calc_data.append({
-        'Kategorie': 'Trainingskosten',
-        'Berechnung': f'{params.participants} Teilnehmer × {calculator.format_currency(params.cost_per_person)}',
-        'Formel': f'{params.participants} × {params.cost_per_person:,.0f}',
-        'Ergebnis': calculator.format_currency(results.training_costs)
-    })
-    
-    calc_data.append({
-        'Kategorie': 'Ausfallkosten',
-        'Berechnung': f'{params.participants} Teilnehmer × {params.training_days} Tage × {params.daily_rate}€',
-        'Formel': f'{params.participants} × {params.training_days} × {params.daily_rate}',
-        'Ergebnis': calculator.format_currency(results.opportunity_costs)
-    })
-    
-    calc_data.append({
-        'Kategorie': '🔸 Gesamtinvestition',
-        'Berechnung': f'{calculator.format_currency(results.training_costs)} + {calculator.format_currency(results.opportunity_costs)}',
-        'Formel': f'{results.training_costs:,.0f} + {results.opportunity_costs:,.0f}',
-        'Ergebnis': calculator.format_currency(results.total_investment)
-    })
-    
-    # 2. Deal Analysis
-    calc_data.append({
-        'Kategorie': '📈 DEAL-ANALYSE',
-        'Berechnung': '',
-        'Formel': '',
-        'Ergebnis': ''
-    })
-    
-    calc_data.append({
-        'Kategorie': 'Aktuelle Deals/Monat',
-        'Berechnung': f'{params.monthly_leads} Leads × {params.current_close_rate}%',
-        'Formel': f'{params.monthly_leads} × {params.current_close_rate/100}',
-        'Ergebnis': f'{calculator.format_number(results.current_deals)} Deals'
-    })
-    
-    calc_data.append({
-        'Kategorie': 'Ziel Deals/Monat',
-        'Berechnung': f'{params.monthly_leads} Leads × {params.target_close_rate}%',
-        'Formel': f'{params.monthly_leads} × {params.target_close_rate/100}',
-        'Ergebnis': f'{calculator.format_number(results.target_deals)} Deals'
-    })
-    
-    calc_data.append({
-        'Kategorie': '🔸 Zusätzliche Deals',
-        'Berechnung': f'{calculator.format_number(results.target_deals)} - {calculator.format_number(results.current_deals)}',
-        'Formel': f'{results.target_deals:.1f} - {results.current_deals:.1f}',
-        'Ergebnis': f'{calculator.format_number(results.additional_deals)} Deals'
-    })
-    
-    # 3. Revenue & Margin
-    calc_data.append({
-        'Kategorie': '💰 UMSATZ & MARGE',
-        'Berechnung': '',
-        'Formel': '',
-        'Ergebnis': ''
-    })
-    
-    calc_data.append({
-        'Kategorie': 'Mehrumsatz/Monat',
-        'Berechnung': f'{calculator.format_number(results.additional_deals)} Deals × {calculator.format_currency(params.deal_value)}',
-        'Formel': f'{results.additional_deals:.1f} × {params.deal_value:,.0f}',
-        'Ergebnis': calculator.format_currency(results.monthly_revenue)
-    })
-    
-    calc_data.append({
-        'Kategorie': 'Zusatzgewinn/Monat',
-        'Berechnung': f'{calculator.format_currency(results.monthly_revenue)} × {params.margin_rate}%',
-        'Formel': f'{results.monthly_revenue:,.0f} × {params.margin_rate/100}',
-        'Ergebnis': calculator.format_currency(results.monthly_margin)
-    })
-    
-    calc_data.append({
-        'Kategorie': '🔸 Zusatzgewinn/Jahr',
-        'Berechnung': f'{calculator.format_currency(results.monthly_margin)} × 12 Monate',
-        'Formel': f'{results.monthly_margin:,.0f} × 12',
-        'Ergebnis': calculator.format_currency(results.annual_margin)
-    })
-    
-    # 4. ROI Calculation
-    calc_data.append({
-        'Kategorie': '🚀 ROI-BERECHNUNG',
-        'Berechnung': '',
-        'Formel': '',
-        'Ergebnis': ''
-    })
-    
-    calc_data.append({
-        'Kategorie': 'Nettogewinn',
-        'Berechnung': f'{calculator.format_currency(results.annual_margin)} - {calculator.format_currency(results.total_investment)}',
-        'Formel': f'{results.annual_margin:,.0f} - {results.total_investment:,.0f}',
-        'Ergebnis': calculator.format_currency(results.net_benefit)
-    })
-    
-    calc_data.append({
-        'Kategorie': 'ROI %',
-        'Berechnung': f'({calculator.format_currency(results.net_benefit)} ÷ {calculator.format_currency(results.total_investment)}) × 100',
-        'Formel': f'({results.net_benefit:,.0f} ÷ {results.total_investment:,.0f}) × 100',
-        'Ergebnis': f'{results.roi_percentage:.0f}%'
-    })
-    
-    calc_data.append({
-        'Kategorie': '🔸 Payback-Zeit',
-        'Berechnung': f'({calculator.format_currency(results.total_investment)} ÷ {calculator.format_currency(results.monthly_margin)}) × 30 Tage',
-        'Formel': f'({results.total_investment:,.0f} ÷ {results.monthly_margin:,.0f}) × 30',
-        'Ergebnis': f'{results.payback_days} Tage'
-    })
-    
-    return pd.DataFrame(calc_data)
-
-def create_roi_charts(calculator):
-    """Erstelle interaktive Plotly Charts"""
-    if not calculator.results:
+@st.cache_resource
+def _roi_batch_kernel():
+    """Kompiliere den Batch-Kernel einmal pro Prozess (None, wenn numba fehlt)"""
+    try:
+        import numba
+    except ImportError:
         return None
+    # Seriell: Streamlit führt das Skript in einem Worker-Thread aus, dort hängt das
+    # erste Kompilieren eines parallel=True-Kernels. cache=True legt den Maschinencode
+    # auf der Platte ab, damit neue Prozesse nicht erneut kompilieren.
+    return numba.njit(cache=True)(_roi_batch_loop)
+
+def calculate_roi_batch(params_soa: dict) -> dict:
+    """Berechne alle ROI-Kennzahlen für viele Szenarien auf einmal
+    
+    `params_soa` enthält je Feld von TrainingParameters ein Array oder einen Skalar
+    (training_days/daily_rate sind optional); die Werte werden gegeneinander gebroadcastet.
+    Zurück kommt je Feld von ROIResults ein Array in der gebroadcasteten Form.
+    """
+    values = [np.asarray(params_soa[f.name] if f.name in params_soa or f.default is MISSING else f.default,
+                         dtype=np.float64)
+              for f in fields(TrainingParameters)]
+    arrays = np.broadcast_arrays(*values)
+    flat = [np.ascontiguousarray(a).ravel() for a in arrays]
+    
+    kernel = _roi_batch_kernel()
+    if kernel is None:
+        out = _roi_batch_numpy(*flat)
+    else:
+        # Ausgabe über NumPy anlegen: dessen Allokator ist bei großen Arrays deutlich
+        # günstiger als eine Allokation im Kernel (weniger Page Faults)
+        rows = np.empty((len(ROIResults._fields), flat[0].size))
+        kernel(*flat, rows)
+        out = dict(zip(ROIResults._fields, rows))
+    
+    shape = arrays[0].shape
+    out = {name: arr.reshape(shape) for name, arr in out.items()}
+    out['payback_days'] = out['payback_days'].astype(np.int64)
+    return out
+
+def calculate_roi_grid(params: TrainingParameters, **grid) -> np.ndarray:
+    """Berechne ROI % über ein Parametergitter
+    
+    Jeder Parameter aus `grid` (z.B. target_close_rate=np.arange(...)) ersetzt den
+    Wert aus `params`; die Arrays werden gegeneinander gebroadcastet.
+    """
+    values = {f.name: getattr(params, f.name) for f in fields(TrainingParameters)}
+    values.update(grid)
+    return calculate_roi_batch(values)['roi_percentage']
+
+# Wirkung des Trainings relativ zur Planung: Basis, Best Case (+30%), Worst Case (nur 50%)
+SCENARIO_FACTORS = np.array([1.0, 1.3, 0.5])
+
+def compute_scenarios(params: TrainingParameters, factors: np.ndarray) -> dict:
+    """Berechne Szenarien, in denen das Training `factors`-fach so gut wirkt wie geplant
+    
+    Ein Faktor skaliert die Steigerung der Abschlussquote (und damit die zusätzlichen Deals);
+    zurück kommt je Feld von ROIResults ein Array mit einem Eintrag pro Faktor.
+    """
+    values = {f.name: getattr(params, f.name) for f in fields(TrainingParameters)}
+    rate_gain = params.target_close_rate - params.current_close_rate
+    values['target_close_rate'] = params.current_close_rate + np.asarray(factors, dtype=np.float64) * rate_gain
+    return calculate_roi_batch(values)
+
+CALC_COLUMNS = ['Kategorie', 'Berechnung', 'Formel', 'Ergebnis']
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def create_calculation_breakdown(params: TrainingParameters, results: ROIResults) -> pd.DataFrame:
+    """Erstelle detaillierte Kalkulationsübersicht (gecacht auf Parameter und Ergebnisse)"""
+    return pd.DataFrame(_calculation_rows(params, results), columns=CALC_COLUMNS)
+
+def _calculation_rows(params: TrainingParameters, results: ROIResults) -> list:
+    """Erstelle die Zeilen der Kalkulationsübersicht als Tupel in der Reihenfolge von CALC_COLUMNS"""
+    # Mehrfach verwendete Werte einmal formatieren
+    total_investment = format_currency(results.total_investment)
+    training_costs = format_currency(results.training_costs)
+    opportunity_costs = format_currency(results.opportunity_costs)
+    monthly_revenue = format_currency(results.monthly_revenue)
+    monthly_margin = format_currency(results.monthly_margin)
+    annual_margin = format_currency(results.annual_margin)
+    net_benefit = format_currency(results.net_benefit)
+    current_deals = format_number(results.current_deals)
+    target_deals = format_number(results.target_deals)
+    additional_deals = format_number(results.additional_deals)
+    
+    return [
+        # 1. Investment Breakdown
+        ('💸 INVESTMENT', '', '', ''),
+        ('Trainingskosten',
+         f'{params.participants} Teilnehmer × {format_currency(params.cost_per_person)}',
+         f'{params.participants} × {params.cost_per_person:,.0f}',
+         training_costs),
+        ('Ausfallkosten',
+         f'{params.participants} Teilnehmer × {params.training_days} Tage × {params.daily_rate}€',
+         f'{params.participants} × {params.training_days} × {params.daily_rate}',
+         opportunity_costs),
+        ('🔸 Gesamtinvestition',
+         f'{training_costs} + {opportunity_costs}',
+         f'{results.training_costs:,.0f} + {results.opportunity_costs:,.0f}',
+         total_investment),
+        
+        # 2. Deal Analysis
+        ('📈 DEAL-ANALYSE', '', '', ''),
+        ('Aktuelle Deals/Monat',
+         f'{params.monthly_leads} Leads × {params.current_close_rate}%',
+         f'{params.monthly_leads} × {params.current_close_rate/100}',
+         f'{current_deals} Deals'),
+        ('Ziel Deals/Monat',
+         f'{params.monthly_leads} Leads × {params.target_close_rate}%',
+         f'{params.monthly_leads} × {params.target_close_rate/100}',
+         f'{target_deals} Deals'),
+        ('🔸 Zusätzliche Deals',
+         f'{target_deals} - {current_deals}',
+         f'{results.target_deals:.1f} - {results.current_deals:.1f}',
+         f'{additional_deals} Deals'),
+        
+        # 3. Revenue & Margin
+        ('💰 UMSATZ & MARGE', '', '', ''),
+        ('Mehrumsatz/Monat',
+         f'{additional_deals} Deals × {format_currency(params.deal_value)}',
+         f'{results.additional_deals:.1f} × {params.deal_value:,.0f}',
+         monthly_revenue),
+        ('Zusatzgewinn/Monat',
+         f'{monthly_revenue} × {params.margin_rate}%',
+         f'{results.monthly_revenue:,.0f} × {params.margin_rate/100}',
+         monthly_margin),
+        ('🔸 Zusatzgewinn/Jahr',
+         f'{monthly_margin} × 12 Monate',
+         f'{results.monthly_margin:,.0f} × 12',
+         annual_margin),
+        
+        # 4. ROI Calculation
+        ('🚀 ROI-BERECHNUNG', '', '', ''),
+        ('Nettogewinn',
+         f'{annual_margin} - {total_investment}',
+         f'{results.annual_margin:,.0f} - {results.total_investment:,.0f}',
+         net_benefit),
+        ('ROI %',
+         f'({net_benefit} ÷ {total_investment}) × 100',
+         f'({results.net_benefit:,.0f} ÷ {results.total_investment:,.0f}) × 100',
+         f'{results.roi_percentage:.0f}%'),
+        ('🔸 Payback-Zeit',
+         f'({total_investment} ÷ {monthly_margin}) × 30 Tage',
+         f'({results.total_investment:,.0f} ÷ {results.monthly_margin:,.0f}) × 30',
+         f'{results.payback_days} Tage')
+    ]
+
+# Fester uirevision-Wert: Zoom/Pan des Nutzers bleibt erhalten, wenn ein Rerun neue Daten schickt
+CHART_LAYOUT = dict(height=400, showlegend=False, margin=dict(t=60, b=40), uirevision='roi')
+
+# Die Chart-Builder nutzen st.cache_resource statt st.cache_data: ein Treffer liefert dieselbe
+# Figure statt sie zu entpickeln (~5 ms pro Chart). Das ist sicher, weil st.plotly_chart die
+# Figure nur serialisiert und nie verändert.
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _investment_chart(total_investment: float, annual_margin: float) -> go.Figure:
+    """Investment vs. Jahresgewinn"""
+    fig = go.Figure(go.Bar(x=['Investment', 'Jahresgewinn'], 
+                           y=np.array([total_investment, annual_margin]),
+                           marker_color=['#e74c3c', '#27ae60'],
+                           name='Investment vs Gewinn',
+                           text=[f'{total_investment:,.0f} €', f'{annual_margin:,.0f} €'],
+                           textposition='auto'),
+                    layout=dict(title_text='Investment vs. Jahresgewinn', **CHART_LAYOUT))
+    return fig
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _cumulative_chart(total_investment: float, monthly_margin: float) -> go.Figure:
+    """Monatliche Gewinnentwicklung mit Break-even-Linie"""
+    months = np.arange(13)
+    cumulative = months * monthly_margin - total_investment
+    
+    fig = go.Figure(go.Scattergl(x=months, y=cumulative,
+                                 mode='lines+markers',
+                                 name='Kumulierter Gewinn',
+                                 line=dict(color='#3498db', width=3)),
+                    # Break-even-Linie direkt als Shape + Annotation (entspricht add_hline, ohne eigene Validierungsrunde)
+                    layout=dict(title_text='Monatliche Gewinnentwicklung',
+                                shapes=[dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=0, y1=0,
+                                             line=dict(color='red', dash='dash'))],
+                                annotations=[dict(text='Break-even', showarrow=False, xref='x domain', x=1,
+                                                  xanchor='right', yref='y', y=0, yanchor='bottom')],
+                                **CHART_LAYOUT))
+    return fig
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _sensitivity_chart(params: TrainingParameters) -> go.Figure:
+    """ROI-Sensitivität über die Ziel-Abschlussquote"""
+    close_rates = np.arange(params.target_close_rate - 5, params.target_close_rate + 10, 0.5)
+    roi_values = calculate_roi_grid(params, target_close_rate=close_rates)
+    
+    fig = go.Figure(go.Scattergl(x=close_rates, y=roi_values,
+                                 mode='lines+markers',
+                                 name='ROI Sensitivität',
+                                 line=dict(color='#e67e22', width=3)),
+                    layout=dict(title_text='ROI-Sensitivität', **CHART_LAYOUT))
+    return fig
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _deals_chart(current_deals: float, target_deals: float) -> go.Figure:
+    """Deals pro Monat vorher vs. nachher"""
+    deals = np.array([current_deals, target_deals])
+    fig = go.Figure(go.Bar(x=['Aktuell', 'Nach Training'], y=deals,
+                           marker_color=['#95a5a6', '#3498db'],
+                           name='Deals/Monat',
+                           text=[f'{d:.1f}' for d in deals],
+                           textposition='auto'),
+                    layout=dict(title_text='Vorher vs. Nachher', **CHART_LAYOUT))
+    return fig
+
+def create_roi_charts(results: ROIResults, params: TrainingParameters) -> dict:
+    """Erstelle die vier interaktiven Plotly Charts, jeweils gecacht auf die eigenen Eingaben"""
+    r = results
+    return {
+        'chart_inv': _investment_chart(r.total_investment, r.annual_margin),
+        'chart_cum': _cumulative_chart(r.total_investment, r.monthly_margin),
+        'chart_sens': _sensitivity_chart(params),
+        'chart_prevpost': _deals_chart(r.current_deals, r.target_deals)
+    }
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def create_scenario_matrix(params):
+    """Erstelle die ROI-Heatmap über Ziel-Abschlussquote und Marge"""
+    target_rates = np.arange(params.current_close_rate, params.current_close_rate + 20.5, 1.0)
+    margin_rates = np.arange(5.0, 81.0, 5.0)
+    roi = calculate_roi_grid(params,
+                             target_close_rate=target_rates[np.newaxis, :],
+                             margin_rate=margin_rates[:, np.newaxis])
+    
+    fig = go.Figure(go.Heatmap(
+        x=target_rates, y=margin_rates, z=roi,
+        colorscale='RdYlGn', zmid=0,
+        colorbar=dict(title='ROI %'),
+        hovertemplate='Ziel-Quote: %{x}%<br>Marge: %{y}%<br>ROI: %{z:.0f}%<extra></extra>'
+    ), layout=dict(height=500,
+                   title_text="ROI (12 Monate) nach Ziel-Abschlussquote und Marge",
+                   xaxis_title="Ziel-Abschlussquote (%)",
+                   yaxis_title="Marge pro Deal (%)"))
+    return fig
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_json(params, results, timestamp) -> bytes:
+    """Erstelle den JSON-Export (gecacht, Zeitstempel auf Minuten genau)"""
+    export_data = {
+        "timestamp": timestamp,
+        "scenario": "Joey's Sales-Training ROI Analyse",
+        "parameters": {
+            "participants": params.participants,
+            "cost_per_person": params.cost_per_person,
+            "monthly_leads": params.monthly_leads,
+            "current_close_rate": params.current_close_rate,
+            "target_close_rate": params.target_close_rate,
+            "deal_value": params.deal_value,
+            "margin_rate": params.margin_rate
+        },
+        "results": {
+            "total_investment": results.total_investment,
+            "monthly_revenue": results.monthly_revenue,
+            "monthly_margin": results.monthly_margin,
+            "annual_margin": results.annual_margin,
+            "roi_percentage": results.roi_percentage,
+            "payback_days": results.payback_days
+        },
+        "calculations": [dict(zip(CALC_COLUMNS, row)) for row in _calculation_rows(params, results)]
+    }
+    # orjson ist optional: gleiche Bytes wie json.dumps(indent=2, ensure_ascii=False), aber in C
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(export_data, indent=2, ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(export_data, option=orjson.OPT_INDENT_2)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_csv(params, results) -> bytes:
+    """Erstelle den CSV-Export der Kalkulationstabelle (gecacht)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(CALC_COLUMNS)
+    writer.writerows(_calculation_rows(params, results))
+    return buffer.getvalue().encode('utf-8')
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_ppt(params, results, fmt) -> bytes:
+    """Erstelle den PowerPoint-Text-Export (gecacht)"""
+    ppt_content = f"""# Sales-Training ROI Analyse
+
+## Das Szenario
+- Sales-Team stagniert bei {params.current_close_rate}% Abschlussquote
+- Neue Methodik verspricht {params.target_close_rate}%
+- Training kostet {fmt['total_investment']}
+- CFO und CEO müssen überzeugt werden
+
+## Kern-Ergebnisse
+- Gesamtinvestition: {fmt['total_investment']}
+- Mehrumsatz/Monat: {fmt['monthly_revenue']}
+- Zusatzgewinn/Monat: {fmt['monthly_margin']}
+- ROI (12 Monate): {fmt['roi_percentage']}
+- Payback-Zeit: {results.payback_days} Tage
+- Jahresgewinn: {fmt['annual_margin']}
+
+## Kalkulation im Detail
+- Zusätzliche Deals: {fmt['additional_deals']}/Monat
+- Deal-Wert: {fmt['deal_value']}
+- Marge: {params.margin_rate}%
+- ROI-Multiple: {fmt['return_per_euro']}x
+
+## Empfehlung
+{"✅ KLARE EMPFEHLUNG: Training durchführen!" if results.roi_percentage > 100 else "👍 Training lohnt sich" if results.roi_percentage > 50 else "⚠️ ROI zu niedrig"}
+
+## Top-Argumente für Management
+1. ROI von {fmt['roi_percentage']} ist außergewöhnlich
+2. Payback in nur {results.payback_days} Tagen
+3. {fmt['annual_margin']} zusätzlicher Jahresgewinn
+4. Jeder Euro bringt {fmt['return_per_euro']}€ zurück
+5. Wettbewerbsvorteil durch bessere Sales-Skills
+"""
+    return ppt_content.encode('utf-8')
+
+@st.fragment
+def export_section(params: TrainingParameters, results: ROIResults, fmt: dict):
+    """Export & Download als Fragment: ein Klick auf einen Download-Button rerunt nur diesen Bereich"""
+    st.header("📄 Export & Download")
     
-    r = calculator.results
-    
-    # Create subplots
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=('Investment vs. Jahresgewinn', 'Monatliche Gewinnentwicklung', 
-                       'ROI-Sensitivität', 'Vorher vs. Nachher'),
-        specs=[[{"type": "bar"}, {"type": "scatter"}],
-               [{"type": "scatter"}, {"type": "bar"}]]
-    )
-    
-    # 1. Investment vs Jahresgewinn
-    fig.add_trace(
-        go.Bar(x=['Investment', 'Jahresgewinn'], 
-               y=[r.total_investment, r.annual_margin],
-               marker_color=['#e74c3c', '#27ae60'],
-               name='Investment vs Gewinn',
-               text=[f'{r.total_investment:,.0f} €', f'{r.annual_margin:,.0f} €'],
-               textposition='auto'),
-        row=1, col=1
-    )
-    
-    # 2. Monatliche Entwicklung
-    months = list(range(13))
-    cumulative = [-r.total_investment]
-    for month in range(1, 13):
-        cumulative.append(cumulative[-1] + r.monthly_margin)
-    
-    fig.add_trace(
-        go.Scatter(x=months, y=cumulative,
-                  mode='lines+markers',
-                  name='Kumulierter Gewinn',
-                  line=dict(color='#3498db', width=3)),
-        row=1, col=2
-    )
+    # Ein Zeitpunkt für alle Exporte, damit die Dateinamen zusammenpassen
+    export_time = datetime.now().replace(second=0, microsecond=0)
+    ts = export_time.strftime('%Y%m%d_%H%M')
     
-    # Break-even line
-    fig.add_hline(y=0, line_dash="dash", line_color="red", 
-                  annotation_text="Break-even", row=1, col=2)
-    
-    # 3. ROI Sensitivität
-    close_rates = list(range(int(calculator.parameters.target_close_rate)-5, 
-                            int(calculator.parameters.target_close_rate)+10, 2))
-    roi_values = []
-    
-    for rate in close_rates:
-        temp_deals = calculator.parameters.monthly_leads * (rate/100) - r.current_deals
-        temp_revenue = temp_deals * calculator.parameters.deal_value
-        temp_margin = temp_revenue * (calculator.parameters.margin_rate/100) * 12
-        temp_roi = ((temp_margin - r.total_investment) / r.total_investment) * 100
-        roi_values.append(temp_roi)
-    
-    fig.add_trace(
-        go.Scatter(x=close_rates, y=roi_values,
-                  mode='lines+markers',
-                  name='ROI Sensitivität',
-                  line=dict(color='#e67e22', width=3)),
-        row=2, col=1
-    )
+    # Die Dateien entstehen erst beim Klick: download_button ruft die Lambdas auf, statt bei
+    # jedem Rerun alle drei Exporte zu bauen und an den Browser zu senden
+    col1, col2, col3 = st.columns(3)
     
-    # 4. Vorher vs Nachher
-    scenarios = ['Aktuell', 'Nach Training']
-    deals = [r.current_deals, r.target_deals]
-    
-    fig.add_trace(
-        go.Bar(x=scenarios, y=deals,
-               marker_color=['#95a5a6', '#3498db'],
-               name='Deals/Monat',
-               text=[f'{d:.1f}' for d in deals],
-               textposition='auto'),
-        row=2, col=2
-    )
+    with col1:
+        # JSON Export
+        st.download_button(
+            label="📊 JSON Download",
+            data=lambda: _build_json(params, results, export_time.isoformat()),
+            file_name=f"roi_analyse_{ts}.json",
+            mime="application/json"
+        )
     
-    fig.update_layout(height=800, showlegend=False, 
-                     title_text="Sales-Training ROI Analyse - Interaktive Dashboards")
+    with col2:
+        # CSV Export
+        st.download_button(
+            label="📈 Kalkulationen CSV",
+            data=lambda: _build_csv(params, results),
+            file_name=f"roi_kalkulationen_{ts}.csv",
+            mime="text/csv"
+        )
     
-    return fig
+    with col3:
+        # PowerPoint Text Export
+        st.download_button(
+            label="📊 PowerPoint Text",
+            data=lambda: _build_ppt(params, results, fmt),
+            file_name=f"roi_powerpoint_{ts}.txt",
+            mime="text/plain"
+        )
 
 def main():
     """Hauptfunktion der Streamlit App"""
@@ -361,8 +579,6 @@ def main():
         daily_rate = st.number_input("Tagessatz Ausfallzeit (€)", min_value=200, max_value=1000, value=400, step=50)
     
     # Berechnung
-    calculator = SalesROICalculator()
-    
     params = TrainingParameters(
         participants=participants,
         cost_per_person=cost_per_person,
@@ -375,7 +591,39 @@ def main():
         daily_rate=daily_rate
     )
     
-    results = calculator.calculate_roi(params)
+    # Nur neu rechnen, wenn sich Parameter geändert haben (z.B. nicht beim Aufklappen eines Expanders).
+    # Verglichen wird das Tupel: die Klasse wird bei jedem Rerun neu definiert, == auf Instanzen greift nicht.
+    roi_key = astuple(params)
+    cache = st.session_state.get('roi_cache')
+    if cache is None or cache[0] != roi_key:
+        results = calculate_roi(params)
+        # Basis/Best/Worst in einem Batch statt einzeln hochgerechneter Werte
+        cache = (roi_key, results, create_roi_charts(results, params),
+                 create_calculation_breakdown(params, results),
+                 compute_scenarios(params, SCENARIO_FACTORS))
+        st.session_state['roi_cache'] = cache
+    _, results, charts, calc_df, scenarios = cache
+    
+    # Mehrfach verwendete Werte einmal pro Rerun formatieren
+    fmt = {
+        'total_investment': format_currency(results.total_investment),
+        'training_costs': format_currency(results.training_costs),
+        'opportunity_costs': format_currency(results.opportunity_costs),
+        'monthly_revenue': format_currency(results.monthly_revenue),
+        'monthly_margin': format_currency(results.monthly_margin),
+        'annual_margin': format_currency(results.annual_margin),
+        'net_benefit': format_currency(results.net_benefit),
+        'daily_margin': format_currency(results.monthly_margin / 30),
+        'cost_per_person': format_currency(params.cost_per_person),
+        'deal_value': format_currency(params.deal_value),
+        # Marge je Deal direkt aus den Parametern - keine Division durch additional_deals (0 bei gleicher Quote)
+        'deal_margin': format_currency(params.deal_value * params.margin_rate / 100),
+        'current_deals': format_number(results.current_deals),
+        'target_deals': format_number(results.target_deals),
+        'additional_deals': format_number(results.additional_deals),
+        'roi_percentage': f"{results.roi_percentage:.0f}%",
+        'return_per_euro': f"{results.roi_multiple + 1:.1f}"
+    }
     
     # Main Layout: Results and Calculations side by side
     col_results, col_calc = st.columns([2, 1])
@@ -387,16 +635,16 @@ def main():
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("💸 Gesamtinvestition", calculator.format_currency(results.total_investment))
+            st.metric("💸 Gesamtinvestition", fmt['total_investment'])
         
         with col2:
-            st.metric("📈 Mehrumsatz/Monat", calculator.format_currency(results.monthly_revenue))
+            st.metric("📈 Mehrumsatz/Monat", fmt['monthly_revenue'])
         
         with col3:
-            st.metric("💰 Zusatzgewinn/Monat", calculator.format_currency(results.monthly_margin))
+            st.metric("💰 Zusatzgewinn/Monat", fmt['monthly_margin'])
         
         with col4:
-            st.metric("🚀 ROI (12 Monate)", f"{results.roi_percentage:.0f}%")
+            st.metric("🚀 ROI (12 Monate)", fmt['roi_percentage'])
         
         col5, col6 = st.columns(2)
         
@@ -404,7 +652,7 @@ def main():
             st.metric("⚡ Payback-Zeit", f"{results.payback_days} Tage")
         
         with col6:
-            st.metric("🎖️ Jahresgewinn", calculator.format_currency(results.annual_margin))
+            st.metric("🎖️ Jahresgewinn", fmt['annual_margin'])
         
         # Empfehlung
         st.header("🎯 Empfehlung")
@@ -412,96 +660,83 @@ def main():
         if results.roi_percentage > 100 and results.payback_days < 90:
             st.success("🎉 **KLARE EMPFEHLUNG: TRAINING DURCHFÜHREN!**")
             st.markdown(f"""
-            ✅ ROI von **{results.roi_percentage:.0f}%** ist außergewöhnlich  
+            ✅ ROI von **{fmt['roi_percentage']}** ist außergewöhnlich  
             ✅ Payback in nur **{results.payback_days} Tagen**  
-            ✅ **{calculator.format_currency(results.monthly_revenue)}** Mehrumsatz pro Monat  
-            ✅ **{calculator.format_currency(results.monthly_margin)}** zusätzlicher GEWINN pro Monat  
+            ✅ **{fmt['monthly_revenue']}** Mehrumsatz pro Monat  
+            ✅ **{fmt['monthly_margin']}** zusätzlicher GEWINN pro Monat  
             ✅ **Perfekte Argumentationsbasis für CFO und CEO!**
             """)
         elif results.roi_percentage > 50:
             st.warning("👍 **EMPFEHLUNG: TRAINING LOHNT SICH**")
             st.markdown(f"""
-            ✅ ROI von **{results.roi_percentage:.0f}%** rechtfertigt die Investition  
+            ✅ ROI von **{fmt['roi_percentage']}** rechtfertigt die Investition  
             ✅ Payback-Zeit: **{results.payback_days} Tage**  
-            ✅ Monatlicher Zusatzgewinn: **{calculator.format_currency(results.monthly_margin)}**
+            ✅ Monatlicher Zusatzgewinn: **{fmt['monthly_margin']}**
             """)
         else:
             st.error("⚠️ **VORSICHT: ROI ZU NIEDRIG**")
             st.markdown(f"""
-            ❌ ROI von nur **{results.roi_percentage:.0f}%** rechtfertigt möglicherweise nicht die Investition  
+            ❌ ROI von nur **{fmt['roi_percentage']}** rechtfertigt möglicherweise nicht die Investition  
             ❌ Prüfen Sie die Parameter oder suchen Sie Alternativen  
-            ❌ Monatlicher Zusatzgewinn nur: **{calculator.format_currency(results.monthly_margin)}**
+            ❌ Monatlicher Zusatzgewinn nur: **{fmt['monthly_margin']}**
             """)
     
     with col_calc:
         # Live Kalkulationen
         st.header("🔢 Live-Kalkulationen")
         
-        # Create calculation breakdown
-        calc_df = create_calculation_breakdown(calculator)
+        # Show only relevant columns for mobile (st.table ändert den Frame nicht, keine Kopie nötig)
+        display_df = calc_df[['Kategorie', 'Berechnung', 'Ergebnis']]
         
-        if calc_df is not None:
-            # Style the dataframe
-            def highlight_totals(row):
-                if '🔸' in str(row['Kategorie']) or any(x in str(row['Kategorie']) for x in ['💸', '📈', '💰', '🚀']):
-                    return ['background-color: #f0f2f6; font-weight: bold'] * len(row)
-                return [''] * len(row)
-            
-            # Display calculation table
-            styled_df = calc_df.style.apply(highlight_totals, axis=1)
-            
-            # Show only relevant columns for mobile
-            display_df = calc_df[['Kategorie', 'Berechnung', 'Ergebnis']].copy()
-            
-            st.dataframe(
-                display_df,
-                use_container_width=True,
-                hide_index=True,
-                height=600
-            )
-            
-            # Quick summary box
-            st.info(f"""
-            **🎯 Zusammenfassung:**
-            
-            **Investment:** {calculator.format_currency(results.total_investment)}
-            **Jahresgewinn:** {calculator.format_currency(results.annual_margin)}
-            **ROI:** {results.roi_percentage:.0f}%
-            **Payback:** {results.payback_days} Tage
-            
-            **💡 Fazit:** Jeder investierte Euro bringt {results.roi_multiple + 1:.1f}€ zurück!
-            """)
+        # Statische Tabelle: 16 Zeilen ohne Sortieren/Filtern brauchen kein interaktives Grid
+        st.table(display_df, hide_index=True)
+        
+        # Quick summary box
+        st.info(f"""
+        **🎯 Zusammenfassung:**
+        
+        **Investment:** {fmt['total_investment']}
+        **Jahresgewinn:** {fmt['annual_margin']}
+        **ROI:** {fmt['roi_percentage']}
+        **Payback:** {results.payback_days} Tage
+        
+        **💡 Fazit:** Jeder investierte Euro bringt {fmt['return_per_euro']}€ zurück!
+        """)
     
     # Charts
     st.header("📊 Interaktive Analysen")
     
-    chart = create_roi_charts(calculator)
-    if chart:
-        st.plotly_chart(chart, use_container_width=True)
+    # Vier eigenständige Charts mit stabilen Keys: Streamlit aktualisiert nur die Charts,
+    # deren Daten sich geändert haben, per Plotly.react statt sie neu aufzubauen
+    chart_rows = (('chart_inv', 'chart_cum'), ('chart_sens', 'chart_prevpost'))
+    for row in chart_rows:
+        for col, key in zip(st.columns(2), row):
+            with col:
+                st.plotly_chart(charts[key], use_container_width=True, key=key)
     
     # Szenario-Analysen
     st.header("🔍 Szenario-Analysen")
     
-    tab1, tab2, tab3, tab4 = st.tabs(["🚀 Best Case", "💼 CFO Argumente", "⚠️ Risiken", "💰 Marge-Fokus"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["🚀 Best Case", "💼 CFO Argumente", "⚠️ Risiken", "💰 Marge-Fokus", "🧮 Szenariomatrix"])
     
     with tab1:
-        best_revenue = results.monthly_revenue * 1.3
-        best_profit = best_revenue * (params.margin_rate / 100)
-        best_roi = results.roi_percentage * 1.5
+        best_revenue = scenarios['monthly_revenue'][1]
+        best_profit = scenarios['monthly_margin'][1]
+        best_roi = scenarios['roi_percentage'][1]
         
         st.markdown(f"""
         ### 🚀 BEST CASE SZENARIO
         **Annahme:** Training wirkt sogar besser als erwartet (+30% zum Ziel)
         
         📊 **Zahlen:**
-        - Mehrumsatz: **{calculator.format_currency(best_revenue)}/Monat**
-        - Zusatzgewinn: **{calculator.format_currency(best_profit)}/Monat**
+        - Mehrumsatz: **{format_currency(best_revenue)}/Monat**
+        - Zusatzgewinn: **{format_currency(best_profit)}/Monat**
         - ROI: **~{best_roi:.0f}%**
-        - Payback: **~{int(results.payback_days * 0.7)} Tage**
+        - Payback: **~{scenarios['payback_days'][1]} Tage**
         
         💼 **Joey's Argument:**
         > "Selbst wenn wir konservativ rechnen, ist der ROI fantastisch. 
-        > Im Best Case haben wir **{calculator.format_currency(best_profit * 12)}** zusätzlichen Jahresgewinn!"
+        > Im Best Case haben wir **{format_currency(scenarios['annual_margin'][1])}** zusätzlichen Jahresgewinn!"
         """)
     
     with tab2:
@@ -509,7 +744,7 @@ def main():
         ### 💼 TOP-ARGUMENTE FÜR CFO & CEO
         
         **1️⃣ GEWINN-FOKUS:**
-        > "Training generiert **{calculator.format_currency(results.annual_margin)}** zusätzlichen 
+        > "Training generiert **{fmt['annual_margin']}** zusätzlichen 
         > Jahresgewinn - das ist echtes Geld in der Kasse!"
         
         **2️⃣ SCHNELLE AMORTISATION:**
@@ -517,11 +752,11 @@ def main():
         > schneller als jede Maschine oder Software"
         
         **3️⃣ MARGE-HEBEL:**
-        > "Jeder zusätzliche Deal bringt **{calculator.format_currency(results.monthly_revenue/results.additional_deals * params.margin_rate/100)}** 
+        > "Jeder zusätzliche Deal bringt **{fmt['deal_margin']}** 
         > Gewinn - dauerhaft!"
         
         **4️⃣ WETTBEWERBSDRUCK:**
-        > "Konkurrent nimmt uns täglich **{calculator.format_currency(results.monthly_margin/30)}** 
+        > "Konkurrent nimmt uns täglich **{fmt['daily_margin']}** 
         > Gewinn weg - jeden Monat den wir warten!"
         
         **5️⃣ SKALIERUNG:**
@@ -534,15 +769,15 @@ def main():
         ### ⚠️ RISIKO-ANALYSE
         
         **🎯 Hauptrisiken:**
-        - **Training wirkt nicht:** Selbst bei 50% Wirkung: **{calculator.format_currency(results.annual_margin * 0.5)}** Jahresgewinn
-        - **Marge sinkt:** Auch bei nur **{params.margin_rate-5}%** Marge: **{calculator.format_currency(results.monthly_revenue * (params.margin_rate-5)/100 * 12)}** Jahresgewinn
+        - **Training wirkt nicht:** Selbst bei 50% Wirkung: **{format_currency(scenarios['annual_margin'][2])}** Jahresgewinn
+        - **Marge sinkt:** Auch bei nur **{params.margin_rate-5}%** Marge: **{format_currency(results.monthly_revenue * (params.margin_rate-5)/100 * 12)}** Jahresgewinn
         - **Markt verschlechtert sich:** Training hilft gerade dann!
         
         **❗ GRÖßTES RISIKO: Status Quo!**
-        Entgangener Jahresgewinn: **{calculator.format_currency(results.annual_margin)}**
+        Entgangener Jahresgewinn: **{fmt['annual_margin']}**
         
         **💡 Joey's Fazit:**
-        > "Jeder Tag Verzögerung kostet uns **{calculator.format_currency(results.monthly_margin/30)}** Gewinn!"
+        > "Jeder Tag Verzögerung kostet uns **{fmt['daily_margin']}** Gewinn!"
         """)
     
     with tab4:
@@ -553,163 +788,70 @@ def main():
         **🎯 Warum Marge entscheidend ist:**
         
         **📊 Aktuelle Situation:**
-        {calculator.format_currency(results.monthly_revenue)} Mehrumsatz × {params.margin_rate}% 
-        = **{calculator.format_currency(results.monthly_margin)}** Gewinn
+        {fmt['monthly_revenue']} Mehrumsatz × {params.margin_rate}% 
+        = **{fmt['monthly_margin']}** Gewinn
         
         **📈 Marge-Sensitivität:**
-        Nur 5% mehr Marge bedeutet **{calculator.format_currency(margin_impact)}** mehr Gewinn/Monat!
+        Nur 5% mehr Marge bedeutet **{format_currency(margin_impact)}** mehr Gewinn/Monat!
         
         **📅 Langzeit-Impact:**
-        {params.margin_rate}% Marge über 5 Jahre = **{calculator.format_currency(results.monthly_margin * 60)}** Zusatzgewinn
+        {params.margin_rate}% Marge über 5 Jahre = **{format_currency(results.monthly_margin * 60)}** Zusatzgewinn
         
         **💼 CFO-Argument:**
         > "Training verbessert nicht nur Abschlussquote, sondern auch 
         > Verhandlungsskills → höhere Margen pro Deal!"
         
         **🎯 Bottom Line:**
-        {calculator.format_currency(results.total_investment)} investieren für {calculator.format_currency(results.annual_margin)} Jahresgewinn 
-        = **{(results.annual_margin/results.total_investment-1)*100:.0f}%** reine Gewinnsteigerung!
+        {fmt['total_investment']} investieren für {fmt['annual_margin']} Jahresgewinn 
+        = **{fmt['roi_percentage']}** reine Gewinnsteigerung!
         """)
     
+    with tab5:
+        st.markdown("""
+        ### 🧮 SZENARIOMATRIX
+        **Wie robust ist der Business Case?** ROI für jede Kombination aus Ziel-Abschlussquote und Marge -
+        alle übrigen Parameter wie in der Seitenleiste.
+        """)
+        st.plotly_chart(create_scenario_matrix(params), use_container_width=True, key="scenario_matrix")
+    
     # Detaillierte Berechnungsübersicht (Expandable)
     with st.expander("🔢 Vollständige Berechnungsdetails anzeigen"):
-        if calc_df is not None:
-            st.markdown("### 📋 Komplette Kalkulations-Tabelle")
-            st.dataframe(calc_df, use_container_width=True, hide_index=True)
-            
-            # Additional breakdown
-            st.markdown("### 🔍 Schritt-für-Schritt Erklärung")
-            
-            col1, col2 = st.columns(2)
+        st.markdown("### 📋 Komplette Kalkulations-Tabelle")
+        st.dataframe(calc_df, use_container_width=True, hide_index=True)
+        
+        # Additional breakdown
+        st.markdown("### 🔍 Schritt-für-Schritt Erklärung")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"""
+            **🏗️ INVESTMENT-AUFBAU:**
+            1. **Direkte Trainingskosten:** {params.participants} × {fmt['cost_per_person']} = {fmt['training_costs']}
+            2. **Ausfallkosten:** {params.participants} × {params.training_days} × {params.daily_rate}€ = {fmt['opportunity_costs']}
+            3. **Gesamtinvestition:** {fmt['training_costs']} + {fmt['opportunity_costs']} = **{fmt['total_investment']}**
             
-            with col1:
-                st.markdown(f"""
-                **🏗️ INVESTMENT-AUFBAU:**
-                1. **Direkte Trainingskosten:** {params.participants} × {calculator.format_currency(params.cost_per_person)} = {calculator.format_currency(results.training_costs)}
-                2. **Ausfallkosten:** {params.participants} × {params.training_days} × {params.daily_rate}€ = {calculator.format_currency(results.opportunity_costs)}
-                3. **Gesamtinvestition:** {calculator.format_currency(results.training_costs)} + {calculator.format_currency(results.opportunity_costs)} = **{calculator.format_currency(results.total_investment)}**
-                
-                **📊 DEAL-STEIGERUNG:**
-                1. **Aktuell:** {params.monthly_leads} × {params.current_close_rate}% = {calculator.format_number(results.current_deals)} Deals
-                2. **Nach Training:** {params.monthly_leads} × {params.target_close_rate}% = {calculator.format_number(results.target_deals)} Deals
-                3. **Zusätzlich:** {calculator.format_number(results.target_deals)} - {calculator.format_number(results.current_deals)} = **{calculator.format_number(results.additional_deals)} Deals**
-                """)
+            **📊 DEAL-STEIGERUNG:**
+            1. **Aktuell:** {params.monthly_leads} × {params.current_close_rate}% = {fmt['current_deals']} Deals
+            2. **Nach Training:** {params.monthly_leads} × {params.target_close_rate}% = {fmt['target_deals']} Deals
+            3. **Zusätzlich:** {fmt['target_deals']} - {fmt['current_deals']} = **{fmt['additional_deals']} Deals**
+            """)
+        
+        with col2:
+            st.markdown(f"""
+            **💰 GEWINN-BERECHNUNG:**
+            1. **Mehrumsatz:** {fmt['additional_deals']} × {fmt['deal_value']} = {fmt['monthly_revenue']}
+            2. **Monatsmarge:** {fmt['monthly_revenue']} × {params.margin_rate}% = {fmt['monthly_margin']}
+            3. **Jahresmarge:** {fmt['monthly_margin']} × 12 = **{fmt['annual_margin']}**
             
-            with col2:
-                st.markdown(f"""
-                **💰 GEWINN-BERECHNUNG:**
-                1. **Mehrumsatz:** {calculator.format_number(results.additional_deals)} × {calculator.format_currency(params.deal_value)} = {calculator.format_currency(results.monthly_revenue)}
-                2. **Monatsmarge:** {calculator.format_currency(results.monthly_revenue)} × {params.margin_rate}% = {calculator.format_currency(results.monthly_margin)}
-                3. **Jahresmarge:** {calculator.format_currency(results.monthly_margin)} × 12 = **{calculator.format_currency(results.annual_margin)}**
-                
-                **🚀 ROI-METRIKEN:**
-                1. **Nettogewinn:** {calculator.format_currency(results.annual_margin)} - {calculator.format_currency(results.total_investment)} = {calculator.format_currency(results.net_benefit)}
-                2. **ROI:** ({calculator.format_currency(results.net_benefit)} ÷ {calculator.format_currency(results.total_investment)}) × 100 = **{results.roi_percentage:.0f}%**
-                3. **Payback:** ({calculator.format_currency(results.total_investment)} ÷ {calculator.format_currency(results.monthly_margin)}) × 30 = **{results.payback_days} Tage**
-                """)
+            **🚀 ROI-METRIKEN:**
+            1. **Nettogewinn:** {fmt['annual_margin']} - {fmt['total_investment']} = {fmt['net_benefit']}
+            2. **ROI:** ({fmt['net_benefit']} ÷ {fmt['total_investment']}) × 100 = **{fmt['roi_percentage']}**
+            3. **Payback:** ({fmt['total_investment']} ÷ {fmt['monthly_margin']}) × 30 = **{results.payback_days} Tage**
+            """)
     
     # Export Funktionen
-    st.header("📄 Export & Download")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        # JSON Export
-        export_data = {
-            "timestamp": datetime.now().isoformat(),
-            "scenario": "Joey's Sales-Training ROI Analyse",
-            "parameters": {
-                "participants": params.participants,
-                "cost_per_person": params.cost_per_person,
-                "monthly_leads": params.monthly_leads,
-                "current_close_rate": params.current_close_rate,
-                "target_close_rate": params.target_close_rate,
-                "deal_value": params.deal_value,
-                "margin_rate": params.margin_rate
-            },
-            "results": {
-                "total_investment": results.total_investment,
-                "monthly_revenue": results.monthly_revenue,
-                "monthly_margin": results.monthly_margin,
-                "annual_margin": results.annual_margin,
-                "roi_percentage": results.roi_percentage,
-                "payback_days": results.payback_days
-            },
-            "calculations": calc_df.to_dict('records') if calc_df is not None else []
-        }
-        
-        st.download_button(
-            label="📊 JSON Download",
-            data=json.dumps(export_data, indent=2, ensure_ascii=False),
-            file_name=f"roi_analyse_{datetime.now().strftime('%Y%m%d_%H%M')}.json",
-            mime="application/json"
-        )
-    
-    with col2:
-        # CSV Export
-        if calc_df is not None:
-            st.download_button(
-                label="📈 Kalkulationen CSV",
-                data=calc_df.to_csv(index=False, encoding='utf-8'),
-                file_name=f"roi_kalkulationen_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                mime="text/csv"
-            )
-    
-    with col3:
-        # PowerPoint Text Export
-        ppt_content = f"""# Sales-Training ROI Analyse
-
-## Das Szenario
-- Sales-Team stagniert bei {params.current_close_rate}% Abschlussquote
-- Neue Methodik verspricht {params.target_close_rate}%
-- Training kostet {calculator.format_currency(results.total_investment)}
-- CFO und CEO müssen überzeugt werden
-
-## Kern-Ergebnisse
-- Gesamtinvestition: {calculator.format_currency(results.total_investment)}
-- Mehrumsatz/Monat: {calculator.format_currency(results.monthly_revenue)}
-- Zusatzgewinn/Monat: {calculator.format_currency(results.monthly_margin)}
-- ROI (12 Monate): {results.roi_percentage:.0f}%
-- Payback-Zeit: {results.payback_days} Tage
-- Jahresgewinn: {calculator.format_currency(results.annual_margin)}
-
-## Kalkulation im Detail
-- Zusätzliche Deals: {calculator.format_number(results.additional_deals)}/Monat
-- Deal-Wert: {calculator.format_currency(params.deal_value)}
-- Marge: {params.margin_rate}%
-- ROI-Multiple: {results.roi_multiple + 1:.1f}x
-
-## Empfehlung
-{"✅ KLARE EMPFEHLUNG: Training durchführen!" if results.roi_percentage > 100 else "👍 Training lohnt sich" if results.roi_percentage > 50 else "⚠️ ROI zu niedrig"}
-
-## Top-Argumente für Management
-1. ROI von {results.roi_percentage:.0f}% ist außergewöhnlich
-2. Payback in nur {results.payback_days} Tagen
-3. {calculator.format_currency(results.annual_margin)} zusätzlicher Jahresgewinn
-4. Jeder Euro bringt {results.roi_multiple + 1:.1f}€ zurück
-5. Wettbewerbsvorteil durch bessere Sales-Skills
-"""
-        
-        st.download_button(
-            label="📊 PowerPoint Text",
-            data=ppt_content,
-            file_name=f"roi_powerpoint_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
-            mime="text/plain"
-        )
+    export_section(params, results, fmt)
 
 if __name__ == "__main__":
     main()
-'''
-
-# Write the updated Streamlit app to file
-with open('app.py', 'w', encoding='utf-8') as f:
-    f.write(streamlit_app_content)
-
-print("✅ Streamlit app.py mit detaillierten Kalkulationen wurde erfolgreich aktualisiert!")
-print("🔢 Neue Features:")
-print("   - Live-Kalkulationen in Seitenspalte")
-print("   - Schritt-für-Schritt Berechnungen")
-print("   - Interaktive Kalkulations-Tabelle")
-print("   - Vollständige Berechnungsdetails")
-print("   - Export der Kalkulationen als CSV")
-print("🌐 Bereit für Online-Deployment!")